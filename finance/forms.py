@@ -1,3 +1,5 @@
+from datetime import date
+
 from django import forms
 from .models import Transaction, Budget, Category
 
@@ -27,10 +29,14 @@ class TransactionForm(forms.ModelForm):
 
 
 class BudgetForm(forms.ModelForm):
+    # Budget stores a single first-of-month period; the form still asks for month and year
+    month = forms.IntegerField(min_value=1, max_value=12)
+    year = forms.IntegerField(min_value=2000, max_value=9999)
+
     class Meta:
         model = Budget
-        fields = ['amount', 'month', 'year']
-        widgets = {
-            'month': forms.NumberInput(attrs={'min': 1, 'max': 12}),
-            'year': forms.NumberInput(attrs={'min': 2000}),
-        }
+        fields = ['amount']
+
+    def save(self, commit=True):
+        self.instance.period = date(self.cleaned_data['year'], self.cleaned_data['month'], 1)
+        return super().save(commit=commit)
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0002_transaction_finance_tra_user_id_c2bddd_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'date'], name='finance_tra_user_id_3294c0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'transaction_type'], name='finance_tra_user_id_75a566_idx'),
+        ),
+    ]
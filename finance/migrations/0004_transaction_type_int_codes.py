@@ -0,0 +1,34 @@
+from django.db import migrations
+
+# Stored transaction_type strings and the integer codes that replace them.
+TYPE_CODES = {
+    'Income': '1',
+    'Expense': '2',
+}
+
+
+def forwards(apps, schema_editor):
+    # Rewrite the strings in place, one UPDATE per value, so the follow-up
+    # AlterField only has to cast the column.
+    for model_name in ('Category', 'Transaction'):
+        model = apps.get_model('finance', model_name)
+        for label, code in TYPE_CODES.items():
+            model.objects.filter(transaction_type__iexact=label).update(transaction_type=code)
+
+
+def backwards(apps, schema_editor):
+    for model_name in ('Category', 'Transaction'):
+        model = apps.get_model('finance', model_name)
+        for label, code in TYPE_CODES.items():
+            model.objects.filter(transaction_type=code).update(transaction_type=label)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0003_transaction_finance_tra_user_id_3294c0_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
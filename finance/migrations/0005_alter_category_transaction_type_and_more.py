@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0004_transaction_type_int_codes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='category',
+            name='transaction_type',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Income'), (2, 'Expense')]),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='transaction_type',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Income'), (2, 'Expense')]),
+        ),
+    ]
@@ -0,0 +1,47 @@
+import datetime
+
+from django.db import migrations, models
+
+
+def fill_period(apps, schema_editor):
+    Budget = apps.get_model('finance', 'Budget')
+    budgets = list(Budget.objects.only('id', 'month', 'year'))
+    for budget in budgets:
+        budget.period = datetime.date(budget.year, budget.month, 1)
+    Budget.objects.bulk_update(budgets, ['period'], batch_size=500)
+
+
+def fill_month_year(apps, schema_editor):
+    Budget = apps.get_model('finance', 'Budget')
+    budgets = list(Budget.objects.only('id', 'period'))
+    for budget in budgets:
+        budget.month = budget.period.month
+        budget.year = budget.period.year
+    Budget.objects.bulk_update(budgets, ['month', 'year'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0005_alter_category_transaction_type_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='budget',
+            name='period',
+            field=models.DateField(null=True),
+        ),
+        # Nullable while both representations coexist, so this migration can be reversed
+        migrations.AlterField(
+            model_name='budget',
+            name='month',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='budget',
+            name='year',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.RunPython(fill_period, fill_month_year),
+    ]
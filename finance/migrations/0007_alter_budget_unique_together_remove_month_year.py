@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0006_budget_period'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='budget',
+            name='period',
+            field=models.DateField(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='budget',
+            unique_together={('user', 'period')},
+        ),
+        migrations.RemoveField(
+            model_name='budget',
+            name='month',
+        ),
+        migrations.RemoveField(
+            model_name='budget',
+            name='year',
+        ),
+    ]
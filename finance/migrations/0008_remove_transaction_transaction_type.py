@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:26
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery
+
+
+def reconcile_transaction_type(apps, schema_editor):
+    # The admin could edit a transaction's type independently of its
+    # category. Once the column is gone the category decides, so move each
+    # mismatched transaction to a same-named category of its stored type
+    # (creating it if needed) rather than silently flipping income/expense.
+    Category = apps.get_model('finance', 'Category')
+    Transaction = apps.get_model('finance', 'Transaction')
+    mismatched = (
+        Transaction.objects.exclude(transaction_type=F('category__transaction_type'))
+        .values_list('user_id', 'category_id', 'category__name', 'transaction_type')
+        .distinct()
+    )
+    for user_id, category_id, name, transaction_type in mismatched:
+        category, _ = Category.objects.get_or_create(
+            user_id=user_id, name=name, transaction_type=transaction_type
+        )
+        Transaction.objects.filter(
+            user_id=user_id, category_id=category_id, transaction_type=transaction_type
+        ).update(category=category)
+
+
+def restore_transaction_type(apps, schema_editor):
+    # Reverse only: repopulate the column from each transaction's category
+    Category = apps.get_model('finance', 'Category')
+    Transaction = apps.get_model('finance', 'Transaction')
+    Transaction.objects.update(
+        transaction_type=Subquery(
+            Category.objects.filter(pk=OuterRef('category_id')).values('transaction_type')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0007_alter_budget_unique_together_remove_month_year'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(reconcile_transaction_type, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='finance_tra_user_id_75a566_idx',
+        ),
+        # Nullable first so that unapplying can re-add the column and refill it
+        migrations.AlterField(
+            model_name='transaction',
+            name='transaction_type',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Income'), (2, 'Expense')], null=True),
+        ),
+        migrations.RunPython(migrations.RunPython.noop, restore_transaction_type),
+        migrations.RemoveField(
+            model_name='transaction',
+            name='transaction_type',
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['transaction_type'], name='finance_cat_transac_a48352_idx'),
+        ),
+    ]
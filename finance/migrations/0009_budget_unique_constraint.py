@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0008_remove_transaction_transaction_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='budget',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='budget',
+            constraint=models.UniqueConstraint(fields=('user', 'period'), name='uniq_budget_user_period'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations
+
+
+def normalize_period(apps, schema_editor):
+    # Budgets saved through the admin could carry any day of the month.
+    # Move them to the 1st, which is what every lookup matches on.
+    Budget = apps.get_model('finance', 'Budget')
+    stray = Budget.objects.exclude(period__day=1)
+    if not stray.exists():
+        return
+
+    conflicts = []
+    for budget in stray:
+        first = budget.period.replace(day=1)
+        if Budget.objects.filter(user_id=budget.user_id, period=first).exists():
+            conflicts.append(budget.pk)
+            continue
+        budget.period = first
+        budget.save(update_fields=['period'])
+
+    if conflicts:
+        raise RuntimeError(
+            "Budgets %s fall in a month that already has a first-of-month "
+            "budget for the same user; merge or delete them and re-run the "
+            "migration." % sorted(conflicts)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0009_budget_unique_constraint'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_period, migrations.RunPython.noop),
+    ]
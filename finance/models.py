@@ -1,21 +1,33 @@
 # finance/models.py
+from decimal import Decimal
+
 from django.db import models
+from django.db.models import OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncMonth
 from django.contrib.auth.models import User
 
+# Income/expense are stored as small integers rather than strings, which keeps
+# the type column and the indexes that include it compact.
+class TransactionType(models.IntegerChoices):
+    INCOME = 1, 'Income'
+    EXPENSE = 2, 'Expense'
+
+
+# Shared fallback for empty sums so the literal isn't re-parsed per call
+_ZERO = Decimal('0')
+
+
 # --- NEW CATEGORY MODEL ---
 # This model will store all your custom income and expense categories in the database.
 class Category(models.Model):
-    TRANSACTION_TYPES = [
-        ('Income', 'Income'),
-        ('Expense', 'Expense'),
-    ]
+    TRANSACTION_TYPES = TransactionType.choices
     
     # Each category belongs to a specific user
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     # The name of the category (e.g., "Salary", "Rent")
     name = models.CharField(max_length=100)
-    # The type of the category, either 'Income' or 'Expense'
-    transaction_type = models.CharField(max_length=10, choices=TRANSACTION_TYPES)
+    # The type of the category, either Income or Expense
+    transaction_type = models.PositiveSmallIntegerField(choices=TRANSACTION_TYPES)
 
     def __str__(self):
         return self.name
@@ -24,37 +36,120 @@ class Category(models.Model):
         # Ensures a user cannot have two categories with the same name and type
         unique_together = ('user', 'name', 'transaction_type')
         verbose_name_plural = "Categories"
+        indexes = [
+            # Transactions are filtered by type through their category
+            models.Index(fields=['transaction_type']),
+        ]
+
+
+class TransactionQuerySet(models.QuerySet):
+    def totals_by_type(self):
+        # {TransactionType: Decimal} from one query using filtered sums;
+        # Coalesce turns a type with no rows into Decimal zero, not None
+        totals = self.aggregate(**{
+            type_.name: Coalesce(
+                Sum('amount', filter=Q(category__transaction_type=type_)),
+                _ZERO,
+                output_field=models.DecimalField()
+            )
+            for type_ in TransactionType
+        })
+        return {type_: totals[type_.name] for type_ in TransactionType}
+
+
+class TransactionManager(models.Manager.from_queryset(TransactionQuerySet)):
+    def get_queryset(self):
+        # __str__ reads category.name, so join it instead of one query per row
+        return super().get_queryset().select_related('category')
 
 
 # --- UPDATED TRANSACTION MODEL ---
 class Transaction(models.Model):
-    TRANSACTION_TYPES = [
-        ('Income', 'Income'),
-        ('Expense', 'Expense'),
-    ]
+    TRANSACTION_TYPES = TransactionType.choices
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
-    transaction_type = models.CharField(max_length=10, choices=TRANSACTION_TYPES)
     amount = models.DecimalField(max_digits=10, decimal_places=2)
     
     # The 'category' field is now a relationship to the Category model
     category = models.ForeignKey(Category, on_delete=models.PROTECT)
     
     date = models.DateField()
-    
+
     # The old 'type' field is removed as it's redundant.
-    
+
+    objects = TransactionManager()
+
+    # Income/expense comes from the category; storing it here as well only risked drift
+    @property
+    def transaction_type(self):
+        return self.category.transaction_type
+
+    # Display labels looked up once at class load instead of walking the
+    # choices list on every __str__ call (admin lists, logs).
+    _TYPE_LABEL = dict(TRANSACTION_TYPES)
+
     def __str__(self):
-        return f"{self.get_transaction_type_display()} - {self.category.name} - {self.amount}"
+        return f"{self._TYPE_LABEL[self.category.transaction_type]} - {self.category.name} - {self.amount}"
+
+    class Meta:
+        indexes = [
+            # Category is an integer FK, so this stays compact per entry
+            models.Index(fields=['user', 'category', 'date']),
+            models.Index(fields=['user', 'date']),
+        ]
+
+class BudgetQuerySet(models.QuerySet):
+    def with_spent(self):
+        # Annotate each budget with its month's expense total, so reading a
+        # budget and checking it costs one query instead of two
+        spent = (
+            Transaction.objects.filter(
+                user=OuterRef('user'),
+                category__transaction_type=TransactionType.EXPENSE
+            )
+            .annotate(month=TruncMonth('date'))
+            .filter(month=OuterRef('period'))
+            .values('user')
+            .annotate(total=Sum('amount'))
+            .values('total')
+        )
+        return self.annotate(
+            spent=Coalesce(Subquery(spent), _ZERO, output_field=models.DecimalField())
+        )
+
 
 class Budget(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
-    month = models.IntegerField()
-    year = models.IntegerField()
+    # First day of the budgeted month; one date column instead of month + year
+    period = models.DateField()
+
+    objects = BudgetQuerySet.as_manager()
+
+    @property
+    def month(self):
+        return self.period.month
+
+    @property
+    def year(self):
+        return self.period.year
+
+    def clean(self):
+        # Budget lookups match on the first of the month, so a date picked
+        # elsewhere in the month (e.g. in the admin) is moved to the 1st before
+        # the uniqueness check sees it
+        if self.period:
+            self.period = self.period.replace(day=1)
+
+    def save(self, *args, **kwargs):
+        self.clean()
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.user.username} - {self.month}/{self.year}: {self.amount or 'Not Set'}"
         
     class Meta:
-        unique_together = ('user', 'month', 'year')
\ No newline at end of file
+        constraints = [
+            # One budget per user per month; lookups can rely on get()
+            models.UniqueConstraint(fields=['user', 'period'], name='uniq_budget_user_period'),
+        ]
\ No newline at end of file
@@ -1,25 +1,149 @@
 # tests.py
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth.models import User
-from .models import Transaction, Budget
+from django.core.exceptions import ValidationError
+from .models import Transaction, Budget, Category, TransactionType
+from .views import FORECAST_NUMPY_MIN_MONTHS
 from datetime import date
+from unittest.mock import patch
 
-from finance import models
+# Password hashing is the slowest step in fixture setup; tests don't need a strong hash
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
 
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
 class FinanceTestCase(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(username='testuser', password='12345')
-        Transaction.objects.create(user=self.user, amount=1000, category='Salary', type='Income', date=date.today())
-        Transaction.objects.create(user=self.user, amount=500, category='Food', type='Expense', date=date.today())
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='testuser', password='12345')
+        salary = Category.objects.create(user=cls.user, name='Salary', transaction_type=TransactionType.INCOME)
+        food = Category.objects.create(user=cls.user, name='Food', transaction_type=TransactionType.EXPENSE)
+        Transaction.objects.bulk_create([
+            Transaction(user=cls.user, amount=1000, category=salary, date=date.today()),
+            Transaction(user=cls.user, amount=500, category=food, date=date.today()),
+        ])
 
     def test_transaction_sum(self):
-        income = Transaction.objects.filter(user=self.user, type='Income').aggregate(total=models.Sum('amount'))['total']
-        expense = Transaction.objects.filter(user=self.user, type='Expense').aggregate(total=models.Sum('amount'))['total']
-        self.assertEqual(income, 1000)
-        self.assertEqual(expense, 500)
+        with self.assertNumQueries(1):
+            totals = Transaction.objects.filter(user=self.user).totals_by_type()
+        self.assertEqual(totals[TransactionType.INCOME], 1000)
+        self.assertEqual(totals[TransactionType.EXPENSE], 500)
 
     def test_dashboard_access(self):
         self.client.login(username='testuser', password='12345')
         response = self.client.get('/dashboard/')
         self.assertEqual(response.status_code, 200)
 
+    def test_write_views_reject_other_methods(self):
+        self.client.force_login(self.user)
+        response = self.client.put('/add_income/')
+        self.assertEqual(response.status_code, 405)
+
+    def test_dashboard_totals(self):
+        self.client.force_login(self.user)
+        # session + user, one grouped totals query, page count + page rows
+        with self.assertNumQueries(5):
+            response = self.client.get('/dashboard/')
+        self.assertEqual(response.context['total_income'], 1000)
+        self.assertEqual(response.context['total_expense'], 500)
+        self.assertEqual(response.context['total_savings'], 500)
+
+    def test_dashboard_paginates_history(self):
+        food = Category.objects.get(user=self.user, name='Food')
+        Transaction.objects.bulk_create([
+            Transaction(user=self.user, amount=1, category=food, date=date.today())
+            for _ in range(50)
+        ])
+        self.client.force_login(self.user)
+        response = self.client.get('/dashboard/', {'page': 2})
+        self.assertEqual(len(response.context['page_obj']), 2)
+        self.assertContains(response, 'Page 2 of 2')
+        # All rows share a date; each must appear on exactly one page
+        first_page = self.client.get('/dashboard/').context['page_obj']
+        seen = [t.id for t in first_page] + [t.id for t in response.context['page_obj']]
+        self.assertCountEqual(seen, Transaction.objects.filter(user=self.user).values_list('id', flat=True))
+
+    def test_budget_with_spent(self):
+        Budget.objects.create(user=self.user, amount=400, period=date.today().replace(day=1))
+        with self.assertNumQueries(1):
+            budget = Budget.objects.with_spent().get(user=self.user)
+        self.assertEqual(budget.spent, 500)
+
+    def test_edit_budget_rejects_non_finite_and_oversized_values(self):
+        self.client.force_login(self.user)
+        for value in ('NaN', 'Infinity', 'sNaN', '1e20', '1.234', 'abc'):
+            response = self.client.post('/edit_budget/3/2025/', {'budget': value})
+            self.assertRedirects(response, '/report/', fetch_redirect_response=False)
+        self.assertFalse(Budget.objects.filter(user=self.user).exists())
+
+    def test_budget_period_is_first_of_month(self):
+        budget = Budget(user=self.user, amount=100, period=date(2025, 3, 15))
+        budget.full_clean()
+        budget.save()
+        self.assertEqual(budget.period, date(2025, 3, 1))
+        duplicate = Budget(user=self.user, amount=200, period=date(2025, 3, 20))
+        with self.assertRaises(ValidationError):
+            duplicate.full_clean()
+
+    def test_add_budget_replaces_existing_month(self):
+        today = date.today()
+        self.client.force_login(self.user)
+        for amount in ('300', '450'):
+            self.client.post('/add_budget/', {'amount': amount, 'month': today.month, 'year': today.year})
+        self.assertEqual(Budget.objects.get(user=self.user).amount, 450)
+
+    def test_report_budget_per_month(self):
+        Budget.objects.create(user=self.user, amount=400, period=date.today().replace(day=1))
+        self.client.force_login(self.user)
+        response = self.client.get('/report/')
+        row = response.context['monthly_data'][0]
+        self.assertEqual(row['budget'], 400)
+        self.assertTrue(row['over_budget'])
+        self.assertEqual(response.context['over_budget'], [Budget.objects.get(user=self.user)])
+
+    def test_forecast_rolls_over_year(self):
+        food = Category.objects.get(user=self.user, name='Food')
+        Transaction.objects.filter(user=self.user).delete()
+        Transaction.objects.bulk_create([
+            Transaction(user=self.user, amount=100, category=food, date=date(2024, 11, 5)),
+            Transaction(user=self.user, amount=200, category=food, date=date(2024, 12, 5)),
+        ])
+        self.client.force_login(self.user)
+        response = self.client.get('/forecast/')
+        self.assertEqual(response.context['forecast_labels'], '["Jan 2025", "Feb 2025", "Mar 2025"]')
+        self.assertEqual(response.context['predicted_total'], 300.0)
+
+    def test_forecast_long_history_uses_numpy_fit(self):
+        food = Category.objects.get(user=self.user, name='Food')
+        Transaction.objects.filter(user=self.user).delete()
+        months = 24  # Jan 2023 - Dec 2024
+        self.assertGreaterEqual(months, FORECAST_NUMPY_MIN_MONTHS)
+        Transaction.objects.bulk_create([
+            Transaction(user=self.user, amount=100 + 10 * i, category=food,
+                        date=date(2023 + i // 12, i % 12 + 1, 5))
+            for i in range(months)
+        ])
+        self.client.force_login(self.user)
+        # Long histories must not take the stdlib path
+        with patch('finance.views.statistics.linear_regression', side_effect=AssertionError):
+            response = self.client.get('/forecast/')
+        self.assertEqual(response.context['predicted_month'], 'Jan 2025')
+        self.assertEqual(response.context['predicted_total'], 340.0)
+        self.assertEqual(response.context['forecast_values'], '[340.0, 350.0, 360.0]')
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class TransactionQueryTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='queryuser', password='12345')
+        category = Category.objects.create(user=cls.user, name='Food', transaction_type=TransactionType.EXPENSE)
+        Transaction.objects.bulk_create([
+            Transaction(user=cls.user, amount=amount, category=category, date=date.today())
+            for amount in (10, 20, 30)
+        ])
+
+    def test_str_does_not_query_category_per_row(self):
+        with self.assertNumQueries(1):
+            labels = [str(t) for t in Transaction.objects.filter(user=self.user)]
+        self.assertEqual(len(labels), 3)
@@ -12,12 +12,12 @@ urlpatterns = [
     path('dashboard/', views.dashboard, name='dashboard'),
     path('add_income/', views.add_income, name='add_income'),
     path('add_expense/', views.add_expense, name='add_expense'),
-    path('edit_transaction/<int:transaction_id>/', views.edit_transaction, name='edit_transaction'),
-    path('delete_transaction/<int:transaction_id>/', views.delete_transaction, name='delete_transaction'),
-    path('dashboard/', views.dashboard, name='dashboard'),
     path('forecast/', views.forecast, name='forecast'),
     path('report/', views.report, name='report'),
     path('add_budget/', views.add_budget, name='add_budget'),
+    # Parameterized routes after the static ones
+    path('edit_transaction/<int:transaction_id>/', views.edit_transaction, name='edit_transaction'),
+    path('delete_transaction/<int:transaction_id>/', views.delete_transaction, name='delete_transaction'),
     path('edit_budget/<int:month>/<int:year>/', views.edit_budget, name='edit_budget'),
 
 ]
\ No newline at end of file
@@ -2,23 +2,26 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
-from .models import Transaction, Budget
+from .models import Transaction, Budget, TransactionType
 from .forms import TransactionForm, BudgetForm
 from django.contrib.auth.decorators import login_required
+from django.views.decorators.http import require_http_methods
 from django.shortcuts import get_object_or_404
+from django.core.paginator import Paginator
+from django.http import Http404
+from django.core.exceptions import ValidationError
+from django import forms
 from datetime import date, timedelta
 from django.db.models.functions import ExtractMonth, ExtractYear
-from django.db.models import Sum
-import pandas as pd
-from sklearn.linear_model import LinearRegression
+from django.db.models import F, Sum
 import datetime
 import json
+import statistics
 from decimal import Decimal
 from django.db.models.functions import TruncMonth, TruncYear
 from django.utils import timezone
 from django.contrib import messages
 from finance import models
-from collections import defaultdict
 
 
 def home_view(request):
@@ -55,47 +58,60 @@ def logout_view(request):
 
 @login_required
 def dashboard(request):
-     transactions = Transaction.objects.filter(user=request.user).order_by('-date')
-
-     total_income = Transaction.objects.filter(user=request.user, transaction_type__iexact='Income').aggregate(Sum('amount'))['amount__sum'] or 0
-     total_expense = Transaction.objects.filter(user=request.user, transaction_type__iexact='Expense').aggregate(Sum('amount'))['amount__sum'] or 0
+     # The template renders t.category for every row, so join it up front and
+     # only load the columns the table shows
+     transactions = (
+         Transaction.objects.filter(user=request.user)
+         .select_related('category')
+         .only('date', 'amount', 'category__name', 'category__transaction_type')
+         # id breaks ties between same-day rows so pages don't overlap or skip
+         .order_by('-date', '-id')
+     )
+
+     # Both totals from one query instead of one aggregate per type
+     totals = Transaction.objects.filter(user=request.user).totals_by_type()
+     total_income = totals[TransactionType.INCOME]
+     total_expense = totals[TransactionType.EXPENSE]
      total_savings =abs(total_income - total_expense)
 
+     # Only one page of history is rendered per request
+     page_obj = Paginator(transactions, 50).get_page(request.GET.get('page'))
+
      return render(request, 'finance/dashboard.html', {
-        'transactions': transactions,
+        'page_obj': page_obj,
         'total_income': total_income,
         'total_expense': total_expense,
         'total_savings': total_savings,
     })
 
 @login_required
+@require_http_methods(["GET", "POST"])
 def add_income(request):
     if request.method == 'POST':
         # Pass the current user to the form
-        form = TransactionForm(request.POST, user=request.user, transaction_type='Income')
+        form = TransactionForm(request.POST, user=request.user, transaction_type=TransactionType.INCOME)
         if form.is_valid():
             income = form.save(commit=False)
             income.user = request.user
-            income.transaction_type = 'Income'
             income.save()
             return redirect('dashboard')
     else:
         # Also pass the current user when displaying the empty form
-        form = TransactionForm(user=request.user, transaction_type='Income')
+        form = TransactionForm(user=request.user, transaction_type=TransactionType.INCOME)
     return render(request, 'finance/add_income.html', {'form': form})
     
 
 # finance/views.py
 
 @login_required
+@require_http_methods(["GET", "POST"])
 def add_expense(request):
     if request.method == 'POST':
         # Pass the user to the form to correctly filter categories
-        form = TransactionForm(request.POST, user=request.user, transaction_type='Expense')
+        form = TransactionForm(request.POST, user=request.user, transaction_type=TransactionType.EXPENSE)
         if form.is_valid():
             expense = form.save(commit=False)
             expense.user = request.user
-            expense.transaction_type = 'Expense'
             # Ensure date is set before saving and using it
             if not expense.date:
                 expense.date = timezone.now().date()
@@ -103,42 +119,34 @@ def add_expense(request):
             # Save the expense first to include it in the monthly total
             expense.save() 
             
-            month = expense.date.month
-            year = expense.date.year
-
-            # Budget Check
-            budget = Budget.objects.filter(
-                user=request.user,
-                month=month,
-                year=year
-            ).first()
+            # Budget Check: the month's spent total comes back with the budget row
+            try:
+                budget = Budget.objects.with_spent().get(
+                    user=request.user,
+                    period=expense.date.replace(day=1)
+                )
+            except Budget.DoesNotExist:
+                budget = None
 
             # Only perform the budget check if a budget is set for that month
-            if budget and budget.amount is not None:
-                monthly_expense = Transaction.objects.filter(
-                    user=request.user,
-                    transaction_type='Expense',
-                    date__month=month,
-                    date__year=year
-                ).aggregate(total=Sum('amount'))['total'] or 0
-
-                if monthly_expense > budget.amount:
-                    messages.warning(
-                        request, 
-                        f'⚠️ Alert: You have now exceeded your monthly budget of {budget.amount}.'
-                    )
+            if budget and budget.amount is not None and budget.spent > budget.amount:
+                messages.warning(
+                    request, 
+                    f'⚠️ Alert: You have now exceeded your monthly budget of {budget.amount}.'
+                )
             
             messages.success(request, "✅ Expense added successfully.")
             return redirect('dashboard')
     else:
         # Also pass the user when displaying the empty form
-        form = TransactionForm(user=request.user, transaction_type='Expense')
+        form = TransactionForm(user=request.user, transaction_type=TransactionType.EXPENSE)
         
     return render(request, 'finance/add_expense.html', {'form': form})
 
 
     
 @login_required
+@require_http_methods(["GET", "POST"])
 def edit_transaction(request, transaction_id):
     transaction = get_object_or_404(Transaction, id=transaction_id, user=request.user)
     
@@ -151,7 +159,9 @@ def edit_transaction(request, transaction_id):
             transaction_type=transaction.transaction_type
         )
         if form.is_valid():
-            form.save()
+            # Only the columns the form edits are written; user and type never change here
+            transaction = form.save(commit=False)
+            transaction.save(update_fields=form.Meta.fields)
             return redirect('dashboard')
     else:
         # Also pass the user and transaction type when displaying the form
@@ -165,25 +175,38 @@ def edit_transaction(request, transaction_id):
 
 
 @login_required
+@require_http_methods(["GET", "POST"])
 def delete_transaction(request, transaction_id):
-    transaction = get_object_or_404(Transaction, id=transaction_id, user=request.user)
-    
     if request.method == 'POST':
-        # If the user confirms the deletion via the form, then delete
-        transaction.delete()
+        # If the user confirms the deletion via the form, then delete.
+        # A single owner-scoped DELETE; the row count tells us whether it existed.
+        deleted, _ = Transaction.objects.filter(id=transaction_id, user=request.user).delete()
+        if not deleted:
+            raise Http404("No Transaction matches the given query.")
         messages.success(request, "Transaction deleted successfully.")
         return redirect('dashboard')
-        
+
+    transaction = get_object_or_404(Transaction, id=transaction_id, user=request.user)
     # If it's a GET request, show a confirmation page
     return render(request, 'finance/delete_confirm.html', {'transaction': transaction})
 
 
+# Below this many months the forecast fits its line with the statistics module
+FORECAST_NUMPY_MIN_MONTHS = 24
+
+
+def _add_months(month_start, months):
+    # First day of the month `months` after month_start
+    year, month = divmod(month_start.month - 1 + months, 12)
+    return date(month_start.year + year, month + 1, 1)
+
+
 def forecast(request):
     user = request.user
 
     # Get aggregated expenses per month
     monthly_expense = (
-        Transaction.objects.filter(user=user, transaction_type__iexact='Expense')
+        Transaction.objects.filter(user=user, category__transaction_type=TransactionType.EXPENSE)
         .annotate(month=TruncMonth('date'))
         .values('month')
         .annotate(total=Sum('amount'))
@@ -199,35 +222,31 @@ def forecast(request):
             'warning': 'Not enough data for forecasting.'
         })
 
-    # Convert to DataFrame
-    df = pd.DataFrame(monthly_expense)
-    df['month'] = pd.to_datetime(df['month'])
-    df['month_str'] = df['month'].dt.strftime('%b %Y')
-    df['month_num'] = range(len(df))
+    months = [row['month'] for row in monthly_expense]
+    past_values = [float(row['total']) for row in monthly_expense]
+    n = len(past_values)
 
-    # Train Linear Regression
-    X = df[['month_num']]
-    y = df['total'].astype(float)
-
-    model = LinearRegression()
-    model.fit(X, y)
+    # Fit a straight line to spend over month index. A few years of months
+    # is well within what the stdlib fits directly; numpy is only imported
+    # (lazily, to keep it out of worker startup) for longer histories.
+    if n < FORECAST_NUMPY_MIN_MONTHS:
+        slope, intercept = statistics.linear_regression(range(n), past_values)
+    else:
+        import numpy as np
+        slope, intercept = np.polyfit(np.arange(n), past_values, 1)
 
     # Forecast for next 3 months
-    future_months = list(range(len(df), len(df) + 3))
-    forecast_values = model.predict(pd.DataFrame({'month_num': future_months}))
-    forecast_labels = pd.date_range(
-        start=df['month'].iloc[-1] + pd.DateOffset(months=1),
-        periods=3,
-        freq='MS'
-    ).strftime('%b %Y').tolist()
+    forecast_values = [slope * month_num + intercept for month_num in range(n, n + 3)]
+    forecast_labels = [
+        _add_months(months[-1], offset).strftime('%b %Y') for offset in range(1, 4)
+    ]
 
     # Get next month's prediction separately
     next_month_label = forecast_labels[0]
     next_month_value = round(float(forecast_values[0]), 2)
 
     # Prepare chart data
-    past_labels = df['month_str'].tolist()
-    past_values = [float(val) for val in df['total']]
+    past_labels = [month.strftime('%b %Y') for month in months]
 
     context = {
         'past_labels': json.dumps(past_labels),
@@ -240,13 +259,18 @@ def forecast(request):
 
     return render(request, 'finance/forecast.html', context)
 
+@require_http_methods(["GET", "POST"])
 def add_budget(request):
     if request.method == 'POST':
         form = BudgetForm(request.POST)
         if form.is_valid():
             budget = form.save(commit=False)
-            budget.user = request.user
-            budget.save()
+            # A month has at most one budget; setting it again replaces the amount
+            Budget.objects.update_or_create(
+                user=request.user,
+                period=budget.period,
+                defaults={'amount': budget.amount}
+            )
             messages.success(request, "Budget set successfully.")
             return redirect('dashboard')
     else:
@@ -254,12 +278,18 @@ def add_budget(request):
 
     return render(request, 'finance/add_budget.html', {'form': form})
 
+# Same digits/decimal places as Budget.amount
+BUDGET_AMOUNT_FIELD = forms.DecimalField(max_digits=10, decimal_places=2)
+
+
 @login_required
+@require_http_methods(["GET", "POST"])
 def edit_budget(request, month, year):
     user = request.user
-
-    budget_obj = Budget.objects.filter(user=user, month=month, year=year).first()
-    current_budget = budget_obj.amount if budget_obj else None
+    try:
+        period = date(year, month, 1)
+    except ValueError:
+        raise Http404("Invalid budget month.")
 
     if request.method == 'POST':
         budget_value = request.POST.get('budget')
@@ -268,21 +298,28 @@ def edit_budget(request, month, year):
             budget_value = None
         else:
             try:
-                budget_value = float(budget_value)
-            except ValueError:
+                # Parse straight into Decimal (no float detour) and hold it to
+                # Budget.amount's limits; NaN/Infinity and oversized values fail here
+                budget_value = BUDGET_AMOUNT_FIELD.clean(budget_value)
+            except ValidationError:
                 messages.error(request, "Invalid budget value.")
                 return redirect('report')
 
         Budget.objects.update_or_create(
             user=user,
-            month=month,
-            year=year,
+            period=period,
             defaults={'amount': budget_value}
         )
 
         messages.success(request, "Budget updated successfully!")
         return redirect('report')
 
+    # The form only shows the amount; fetch that single column through the (user, period) index
+    try:
+        current_budget = Budget.objects.values_list('amount', flat=True).get(user=user, period=period)
+    except Budget.DoesNotExist:
+        current_budget = None
+
     return render(request, 'finance/edit_budget.html', {
         'month': month,
         'year': year,
@@ -297,64 +334,57 @@ def report(request):
     transactions = (
         Transaction.objects.filter(user=user)
         .annotate(month=TruncMonth('date'))
-        .values('month', 'transaction_type')
+        .values('month', 'category__transaction_type')
         .annotate(total=Sum('amount'))
         .order_by('month')
     )
 
-    # Organize by month
-    monthly = defaultdict(lambda: {'Income': 0, 'Expense': 0})
-    months_seen = set()
-
+    # Organize by month; rows arrive ordered by month, so a plain dict keeps
+    # them in order without a separate sort
+    monthly = {}
     for tx in transactions:
-        month = tx['month']
-        tx_type = tx['transaction_type'].capitalize()
-        monthly[month][tx_type] = tx['total']
-        months_seen.add(month)
+        totals = monthly.setdefault(tx['month'], {TransactionType.INCOME: 0, TransactionType.EXPENSE: 0})
+        totals[tx['category__transaction_type']] = tx['total']
+
+    # Monthly budgets (not category-wise), fetched once and keyed by period
+    budgets_map = dict(Budget.objects.filter(user=user).values_list('period', 'amount'))
 
     # Build structured list
     monthly_data = []
-    for date in sorted(months_seen):
-        income = monthly[date].get('Income', 0)
-        expense = monthly[date].get('Expense', 0)
+    for month, totals in monthly.items():
+        income = totals[TransactionType.INCOME]
+        expense = totals[TransactionType.EXPENSE]
         savings = abs(income - expense)
 
-        # Get monthly budget (not category-wise)
-        budget_obj = Budget.objects.filter(user=user, month=date.month, year=date.year).first()
+        budget_amount = budgets_map.get(month)
 
         monthly_data.append({
-            'month': date.strftime('%B %Y'),
-            'month_num': date.month,
-            'year': date.year,
+            'month': month.strftime('%B %Y'),
+            'month_num': month.month,
+            'year': month.year,
             'income': round(income, 2),
             'expense': round(expense, 2),
-            'budget': budget_obj.amount if budget_obj else None,
+            'budget': budget_amount,
             'savings': round(savings, 2),
-            'budget': budget_obj.amount if budget_obj else None,
-            'over_budget': budget_obj and budget_obj.amount is not None and expense > budget_obj.amount
+            'over_budget': budget_amount is not None and expense > budget_amount
         })
 
-    # Totals
-    total_income = sum(item['income'] for item in monthly_data)
-    total_expense = sum(item['expense'] for item in monthly_data)
+    # Totals over the whole history, summed by the database rather than
+    # re-adding the rounded monthly figures
+    totals = Transaction.objects.filter(user=user).totals_by_type()
+    total_income = totals[TransactionType.INCOME]
+    total_expense = totals[TransactionType.EXPENSE]
     total_savings = abs(total_income - total_expense)
 
-    # Budget alerts (current month only)
-    current_month = timezone.now().month
-    current_year = timezone.now().year
-    budgets = Budget.objects.filter(user=user, month=current_month, year=current_year)
-    over_budget = []
-
-    for b in budgets:
-        total_spent = Transaction.objects.filter(
+    # Budget alerts (current month only); the month's spending is summed once
+    # in the same query and compared there
+    over_budget = list(
+        Budget.objects.with_spent().filter(
             user=user,
-            transaction_type='Expense',
-            date__month=current_month,
-            date__year=current_year
-        ).aggregate(total=Sum('amount'))['total'] or 0
-
-        if total_spent > b.amount:
-            over_budget.append(b.category)
+            period=timezone.now().date().replace(day=1),
+            spent__gt=F('amount')
+        )
+    )
 
     context = {
         'monthly_data': monthly_data,
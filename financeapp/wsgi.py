@@ -10,7 +10,14 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "financeapp.settings")
 
 application = get_wsgi_application()
+
+# Import the URLconf (and the views behind it), compile every route's regex
+# and build the reverse() lookup tables at worker boot, so the first request
+# doesn't pay for it. Done here rather than in AppConfig.ready() so
+# management commands stay fast.
+_warm_reverse_dict = get_resolver().reverse_dict